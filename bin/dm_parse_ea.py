@@ -33,14 +33,14 @@ def read_in_logfile(path):
 #Grabs the starts of blocks and returns rows for them
 def get_blocks(log,vid_info):
     #identifies the video trial types (as opposed to button press events etc)
-    mask = ["vid" in log['Code'][i] for i in range(0,log.shape[0])]
+    mask = log['Code'].str.contains('vid', regex=False, na=False)
 
     #creates the dataframe with onset times and event types
     df = pd.DataFrame({'onset':log.loc[mask]['Time'],
                   'trial_type':log.loc[mask]['Event Type'],
                   'movie_name':log.loc[mask]['Code']})
     #adds trial type info
-    df['trial_type']=df['movie_name'].apply(lambda x: "circle_block" if "cvid" in x else "EA_block")
+    df['trial_type']=np.where(df['movie_name'].str.contains('cvid', regex=False), "circle_block", "EA_block")
     #add durations and convert them into the units here? 10000ths of seconds
     df['duration']=df['movie_name'].apply(lambda x: int(vid_info[x]['duration'])*10000 if x in vid_info else "n/a")
     #adds names of stim_files, according to the vid_info spreadsheet
@@ -70,7 +70,7 @@ def get_series_standard(gold_standard, block_name):
 #grabs partcipant ratings
 def get_ratings(log):
 
-    rating_mask = ["rating" in log['Code'][i] for i in range(0,log.shape[0])]
+    rating_mask = log['Code'].str.contains('rating', regex=False, na=False)
 
     #So this grabs from the stim row and not the button press row, but there's like 50 10000ths of a second difference so i feel fine doing that. otherwise it creates risk for other errors if the sheets are weird.
     #gives the time and value of the partiicipant rating
@@ -172,29 +172,22 @@ def block_scores(ratings_dict,combo):
             start=interval[x]
             end=interval[x+1]
             #things that start within the time interval plus the one that starts during the time interval
-            sub_block= block[block['onset'].between(start,end) | block['onset'].between(start,end).shift(-1)]
+            in_interval=block['onset'].between(start,end)
+            sub_block= block[in_interval | in_interval.shift(-1)]
             block_length=end-start
             if len(sub_block) !=0:
-                ratings=[]
-                last_val=sub_block.participant_value.iloc[[-1]]
-                for index, row in sub_block.iterrows():
-                    #for rows that are in the thing
-                    if (row.onset < start): #and (row.onset+row.duration)>start: #what's the best order to do these conditionals in?
-                        #if (row.onset+row.duration)>start: # this is just to be safe i guess, gonna see what happens if i comment it out
-                        numerator=(row.onset+row.rating_duration)-start
-                    else:#if row.onset>=start and row.onset<end: #ooo should i do row.onset<end for everything??
-                        if (row.onset+row.rating_duration) <= end:
-                            numerator=row.rating_duration
-                        elif (row.onset+row.rating_duration) > end:
-                            numerator = end - row.onset
-                        else:
-                            numerator=9999999
-                    last_row=row.participant_value
-                    #okay so i want to change this to actually create the beginnings of an important row in our df!
-                    ratings.append({'start':start,'end':end,'row_time':row.rating_duration, 'row_start': row.onset, 'block_length':block_length,'rating':row.participant_value, 'time_held':numerator})#, 'start': start, 'end':end})
-                    nums=[float(d['rating']) for d in ratings]
-                    times=[float(d['time_held'])/block_length for d in ratings]
-                    avg=np.sum(np.multiply(nums,times))
+                #time each rating was held within the interval, worked out for the whole sub block at once
+                #ratings that started before the interval only count from the start, ones that run past the end get cut off
+                #a missing rating_duration fails every comparison and falls through to the 9999999 default, same as before
+                onsets=sub_block.onset.values
+                held=sub_block.rating_duration.values
+                ends=onsets+held
+                time_held=np.select([onsets < start, ends <= end, ends > end],
+                                    [ends-start, held, end-onsets],
+                                    default=9999999)
+                nums=sub_block.participant_value.astype(float).values
+                avg=np.sum(np.multiply(nums,time_held/block_length))
+                last_row=sub_block.participant_value.iloc[-1]
             else:
                 avg=last_row
 
@@ -285,8 +278,9 @@ def main():
     EA_mask = combo.ix[combo.trial_type=="EA_block"]
 
     score_file=open("/projects/gherman/ea_parser/out/compiled_scores.csv","a+")
-    for index, row in EA_mask.iterrows():
-        score_file.write("\n{},{},{},{}".format(sub_id,EA_mask.stim_file.ix[index],EA_mask.block_score.ix[index], log_file))
+    score_rows=["\n{},{},{},{}".format(sub_id, stim_file, block_score, log_file)
+                for stim_file, block_score in zip(EA_mask.stim_file, EA_mask.block_score)]
+    score_file.write("".join(score_rows))
     score_file.close()
     #Do i also want to write a csv that says where each thing was generated from? probably.
 
@@ -151,11 +151,8 @@ def main():
 
     # Step 1: Loop through subjects available in the feenics pipeline directory
     if not subjects:
-        subjects = [
-            s
-            for s in os.listdir(feenics_dir)
-            if os.path.isdir(os.path.join(feenics_dir, s))
-        ]
+        with os.scandir(feenics_dir) as entries:
+            subjects = [e.name for e in entries if e.is_dir()]
 
     # Step 1a: Get BIDS subjects
     layout = BIDSLayout(fmriprep, validate=False)
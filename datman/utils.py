@@ -828,12 +828,11 @@ def define_folder(path):
     exist, this makes it so, unless we lack the permissions to do so, which
     leads to a graceful exit.
     """
-    if not os.path.isdir(path):
-        try:
-            os.makedirs(path)
-        except OSError as e:
-            logger.error(f"failed to make directory {path}")
-            raise (e)
+    try:
+        os.makedirs(path, exist_ok=True)
+    except OSError as e:
+        logger.error(f"failed to make directory {path}")
+        raise (e)
 
     if not has_permissions(path):
         raise OSError(f"User does not have permission to access {path}")
@@ -939,8 +938,7 @@ def makedirs(path):
     """
     Make the directory (including parent directories) if they don't exist
     """
-    if not os.path.exists(path):
-        os.makedirs(path)
+    os.makedirs(path, exist_ok=True)
 
 
 def check_returncode(returncode):